@@ -5,6 +5,8 @@ use crate::parser::Parser;
 use crate::executor::DataStreamExecutor;
 use crate::runtime::Value;
 use std::collections::HashMap;
+use std::fmt::Write as _;
+use std::io::{self, Write};
 
 /// DPLang 解释器
 pub struct DPLangInterpreter {
@@ -114,13 +116,14 @@ fn parse_json_object(json_str: &str) -> Result<HashMap<String, Value>, String> {
     let content = &json_str[1..json_str.len()-1];
     
     for pair in content.split(',') {
-        let parts: Vec<&str> = pair.split(':').collect();
-        if parts.len() != 2 {
-            continue;
-        }
+        // 单次切分出键和值，不为每个键值对分配 Vec
+        let (key_str, value_str) = match pair.split_once(':') {
+            Some((k, v)) if !v.contains(':') => (k, v),
+            _ => continue,
+        };
         
-        let key = parts[0].trim().trim_matches('"').to_string();
-        let value_str = parts[1].trim();
+        let key = key_str.trim().trim_matches('"').to_string();
+        let value_str = value_str.trim();
         
         let value = if value_str.starts_with('"') && value_str.ends_with('"') {
             Value::String(value_str.trim_matches('"').to_string())
@@ -152,19 +155,15 @@ pub fn parse_csv(csv_str: &str) -> Result<Vec<HashMap<String, Value>>, String> {
     // 第一行是表头
     let headers: Vec<&str> = lines[0].split(',').map(|s| s.trim()).collect();
     
-    let mut result = Vec::new();
+    let mut result = Vec::with_capacity(lines.len() - 1);
     
     // 解析数据行
     for line in &lines[1..] {
-        let values: Vec<&str> = line.split(',').map(|s| s.trim()).collect();
-        let mut row = HashMap::new();
+        let mut row = HashMap::with_capacity(headers.len());
         
-        for (i, &header) in headers.iter().enumerate() {
-            if i >= values.len() {
-                break;
-            }
-            
-            let value_str = values[i];
+        // 字段与表头逐一配对，边切分边解析，不收集中间数组
+        let values = line.split(',').map(|s| s.trim());
+        for (&header, value_str) in headers.iter().zip(values) {
             let value = if let Ok(n) = value_str.parse::<f64>() {
                 Value::Number(n)
             } else if value_str == "true" {
@@ -243,8 +242,15 @@ fn format_value_json(value: &Value) -> String {
 
 /// 格式化输出为 CSV
 pub fn format_output_csv(output: &[HashMap<String, Value>]) -> String {
+    let mut buf = Vec::new();
+    write_output_csv(output, &mut buf).expect("写入内存缓冲区不会失败");
+    String::from_utf8(buf).expect("CSV 输出必须是有效的 UTF-8")
+}
+
+/// 以 CSV 格式流式写出结果，无需先在内存中拼接完整文本
+pub fn write_output_csv<W: Write>(output: &[HashMap<String, Value>], writer: &mut W) -> io::Result<()> {
     if output.is_empty() {
-        return String::new();
+        return Ok(());
     }
     
     // 收集所有列名
@@ -258,28 +264,44 @@ pub fn format_output_csv(output: &[HashMap<String, Value>]) -> String {
     }
     headers.sort();
     
-    let mut result = String::new();
-    
     // 写入表头
-    result.push_str(&headers.join(","));
-    result.push('\n');
+    writer.write_all(headers.join(",").as_bytes())?;
+    writer.write_all(b"\n")?;
     
-    // 写入数据行
+    // 写入数据行：复用同一个行缓冲区，每行只写一次
+    let mut line = String::new();
     for row in output {
-        let values: Vec<String> = headers
-            .iter()
-            .map(|h| {
-                row.get(h)
-                    .map(format_value_csv)
-                    .unwrap_or_else(|| String::new())
-            })
-            .collect();
+        line.clear();
+        for (i, h) in headers.iter().enumerate() {
+            if i > 0 {
+                line.push(',');
+            }
+            if let Some(value) = row.get(h) {
+                push_value_csv(&mut line, value);
+            }
+        }
+        line.push('\n');
         
-        result.push_str(&values.join(","));
-        result.push('\n');
+        writer.write_all(line.as_bytes())?;
     }
     
-    result
+    Ok(())
+}
+
+/// 将单个值追加到 CSV 行缓冲区，常见标量不产生临时字符串
+fn push_value_csv(line: &mut String, value: &Value) {
+    match value {
+        Value::Null => {}
+        Value::Bool(b) => line.push_str(if *b { "true" } else { "false" }),
+        Value::Number(n) => {
+            let _ = write!(line, "{}", n);
+        }
+        Value::Decimal(d) => {
+            let _ = write!(line, "{}", d);
+        }
+        Value::String(s) if !s.contains(',') && !s.contains('"') => line.push_str(s),
+        other => line.push_str(&format_value_csv(other)),
+    }
 }
 
 /// 格式化单个值为 CSV
@@ -340,6 +362,23 @@ mod tests {
         assert!(csv.contains("Alice,95.5"));
     }
 
+    #[test]
+    fn test_write_output_csv_matches_format() {
+        let mut row1 = HashMap::new();
+        row1.insert("name".to_string(), Value::String("Alice".to_string()));
+        row1.insert("score".to_string(), Value::Number(95.5));
+        
+        let mut row2 = HashMap::new();
+        row2.insert("name".to_string(), Value::String("Bob".to_string()));
+        
+        let output = vec![row1, row2];
+        let mut buf = Vec::new();
+        write_output_csv(&output, &mut buf).unwrap();
+        
+        assert_eq!(String::from_utf8(buf).unwrap(), "name,score\nAlice,95.5\nBob,\n");
+        assert_eq!(format_output_csv(&output), "name,score\nAlice,95.5\nBob,\n");
+    }
+
     #[test]
     fn test_interpreter_api() {
         let source = r#"
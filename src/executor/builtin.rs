@@ -80,23 +80,20 @@ impl Executor {
             return Err(RuntimeError::type_error("max 需要至少一个参数"));
         }
         
-        let values: Vec<f64> = if let Value::Array(arr) = &args[0] {
-            arr.iter()
-                .filter(|v| !matches!(v, Value::Null))
-                .map(|v| v.to_number())
-                .collect::<Result<Vec<_>, _>>()?
-        } else {
-            args.iter()
-                .filter(|v| !matches!(v, Value::Null))
-                .map(|v| v.to_number())
-                .collect::<Result<Vec<_>, _>>()?
-        };
+        // 直接折叠，不收集中间数组
+        let mut max_val = f64::NEG_INFINITY;
+        let mut count = 0;
+        for v in Self::numeric_operands(args) {
+            if !matches!(v, Value::Null) {
+                max_val = max_val.max(v.to_number()?);
+                count += 1;
+            }
+        }
         
-        if values.is_empty() {
+        if count == 0 {
             return Ok(Value::Null);
         }
         
-        let max_val = values.into_iter().fold(f64::NEG_INFINITY, f64::max);
         Ok(Value::Number(max_val))
     }
     
@@ -106,23 +103,20 @@ impl Executor {
             return Err(RuntimeError::type_error("min 需要至少一个参数"));
         }
         
-        let values: Vec<f64> = if let Value::Array(arr) = &args[0] {
-            arr.iter()
-                .filter(|v| !matches!(v, Value::Null))
-                .map(|v| v.to_number())
-                .collect::<Result<Vec<_>, _>>()?
-        } else {
-            args.iter()
-                .filter(|v| !matches!(v, Value::Null))
-                .map(|v| v.to_number())
-                .collect::<Result<Vec<_>, _>>()?
-        };
+        // 直接折叠，不收集中间数组
+        let mut min_val = f64::INFINITY;
+        let mut count = 0;
+        for v in Self::numeric_operands(args) {
+            if !matches!(v, Value::Null) {
+                min_val = min_val.min(v.to_number()?);
+                count += 1;
+            }
+        }
         
-        if values.is_empty() {
+        if count == 0 {
             return Ok(Value::Null);
         }
         
-        let min_val = values.into_iter().fold(f64::INFINITY, f64::min);
         Ok(Value::Number(min_val))
     }
     
@@ -149,7 +143,8 @@ impl Executor {
         
         for arg in args {
             match arg {
-                Value::Array(arr) => result.extend(arr.clone()),
+                // 逐个克隆元素，避免先复制出一个完整的临时数组
+                Value::Array(arr) => result.extend(arr.iter().cloned()),
                 other => result.push(other.clone()),
             }
         }
@@ -174,7 +169,7 @@ impl Executor {
             _ => return Err(RuntimeError::type_error("map 的第二个参数必须是 Lambda")),
         };
         
-        let mut result = Vec::new();
+        let mut result = Vec::with_capacity(arr.len());
         for item in arr {
             let mapped = self.execute_lambda(
                 lambda.0.clone(),
@@ -347,7 +342,7 @@ impl Executor {
                     return Err(RuntimeError::type_error("Array 的 Lambda 必须有 1 个参数"));
                 }
                 
-                let mut result = Vec::new();
+                let mut result = Vec::with_capacity(size);
                 for i in 0..size {
                     let value = self.execute_lambda(
                         params.clone(),
@@ -374,24 +369,21 @@ impl Executor {
             return Err(RuntimeError::type_error("mean 需要至少一个参数"));
         }
         
-        let values: Vec<f64> = if let Value::Array(arr) = &args[0] {
-            arr.iter()
-                .filter(|v| !matches!(v, Value::Null))
-                .map(|v| v.to_number())
-                .collect::<Result<Vec<_>, _>>()?  
-        } else {
-            args.iter()
-                .filter(|v| !matches!(v, Value::Null))
-                .map(|v| v.to_number())
-                .collect::<Result<Vec<_>, _>>()?  
-        };
+        // 一次遍历同时累加总和与个数
+        let mut sum = 0.0;
+        let mut count = 0;
+        for v in Self::numeric_operands(args) {
+            if !matches!(v, Value::Null) {
+                sum += v.to_number()?;
+                count += 1;
+            }
+        }
         
-        if values.is_empty() {
+        if count == 0 {
             return Ok(Value::Null);
         }
         
-        let sum: f64 = values.iter().sum();
-        Ok(Value::Number(sum / values.len() as f64))
+        Ok(Value::Number(sum / count as f64))
     }
     
     /// first 函数 - 获取数组第一个元素
@@ -573,6 +565,14 @@ impl Executor {
         }
     }
     
+    /// 聚合函数的操作数：首个参数是数组时取数组元素，否则取全部参数
+    fn numeric_operands(args: &[Value]) -> &[Value] {
+        match args.first() {
+            Some(Value::Array(arr)) => arr.as_slice(),
+            _ => args,
+        }
+    }
+    
     /// 辅助函数 - 判断两个值是否相等
     fn values_equal(&self, a: &Value, b: &Value) -> bool {
         match (a, b) {
@@ -54,10 +54,13 @@ impl DataStreamExecutor {
             None
         };
         
+        // 每个输入行至多产生一个输出行，按输入行数预分配
+        let output_matrix = Vec::with_capacity(normalized_input.len());
+        
         DataStreamExecutor {
             script,
             input_matrix: Rc::new(normalized_input),
-            output_matrix: Vec::new(),
+            output_matrix,
             current_index: 0,
             precision,
             packages: HashMap::new(),
@@ -187,25 +190,12 @@ impl DataStreamExecutor {
     /// end_offset: 结束偏移量（相对于当前行，0表示当前行）
     /// 返回: [current_index - start_offset, ..., current_index - end_offset]
     pub fn get_input_slice(&self, name: &str, start_offset: usize, end_offset: usize) -> Result<Value, RuntimeError> {
-        // 构建列数据
-        let mut column_data = Vec::new();
+        // 构建列数据，历史不足的部分填充 null
+        let mut column_data = vec![Value::Null; start_offset.saturating_sub(self.current_index)];
         
-        // 计算实际索引范围
-        let start_idx = if start_offset > self.current_index {
-            // 历史不足，填充 null
-            for _ in 0..(start_offset - self.current_index) {
-                column_data.push(Value::Null);
-            }
-            0
-        } else {
-            self.current_index - start_offset
-        };
-        
-        let end_idx = if end_offset > self.current_index {
-            0
-        } else {
-            self.current_index - end_offset
-        };
+        // 计算实际索引范围（饱和减法代替越界分支）
+        let start_idx = self.current_index.saturating_sub(start_offset);
+        let end_idx = self.current_index.saturating_sub(end_offset);
         
         // 提取数据
         for i in start_idx..=end_idx {
@@ -236,25 +226,14 @@ impl DataStreamExecutor {
     
     /// 获取输出矩阵的切片
     pub fn get_output_slice(&self, name: &str, start_offset: usize, end_offset: usize) -> Result<Value, RuntimeError> {
-        let mut column_data = Vec::new();
+        if end_offset == 0 {
+            return Err(RuntimeError::type_error("无法获取当前行的输出值"));
+        }
         
-        let start_idx = if start_offset > self.current_index {
-            for _ in 0..(start_offset - self.current_index) {
-                column_data.push(Value::Null);
-            }
-            0
-        } else {
-            self.current_index - start_offset
-        };
+        let mut column_data = vec![Value::Null; start_offset.saturating_sub(self.current_index)];
         
-        let end_idx = if end_offset > self.current_index || end_offset == 0 {
-            if end_offset == 0 {
-                return Err(RuntimeError::type_error("无法获取当前行的输出值"));
-            }
-            0
-        } else {
-            self.current_index - end_offset
-        };
+        let start_idx = self.current_index.saturating_sub(start_offset);
+        let end_idx = self.current_index.saturating_sub(end_offset);
         
         for i in start_idx..=end_idx {
             let value = self.output_matrix
@@ -315,7 +294,7 @@ impl DataStreamExecutor {
             
             // 3. 收集输出
             if let Some(Value::Array(output_values)) = result {
-                let mut output_row = HashMap::new();
+                let mut output_row = HashMap::with_capacity(output.len());
                 
                 for (i, param) in output.iter().enumerate() {
                     if let Some(value) = output_values.get(i) {
@@ -71,7 +71,7 @@ impl Executor {
             }
             
             Expr::Array(elements) => {
-                let mut arr = Vec::new();
+                let mut arr = Vec::with_capacity(elements.len());
                 for elem in elements {
                     arr.push(self.execute_expr(elem)?);
                 }
@@ -123,15 +123,16 @@ impl OutputManager {
     /// 刷新缓冲区到文件
     fn flush_buffer(&mut self) -> Result<(), RuntimeError> {
         if let Some(ref mut writer) = self.file_writer {
-            // 写入CSV格式
+            // 先把整批数据格式化为一块CSV文本，再一次性写入
+            // 大于 BufWriter 容量时会直接写入文件，避免二次拷贝
+            let mut chunk = String::new();
             for row in &self.buffer {
-                let line = Self::format_row_as_csv_static(row, &self.column_order);
-                writer.write_all(line.as_bytes())
-                    .map_err(|e| RuntimeError::type_error(&format!("写入文件失败: {}", e)))?;
-                writer.write_all(b"\n")
-                    .map_err(|e| RuntimeError::type_error(&format!("写入文件失败: {}", e)))?;
+                Self::push_row_as_csv_static(&mut chunk, row, &self.column_order);
+                chunk.push('\n');
             }
-            
+
+            writer.write_all(chunk.as_bytes())
+                .map_err(|e| RuntimeError::type_error(&format!("写入文件失败: {}", e)))?;
             writer.flush()
                 .map_err(|e| RuntimeError::type_error(&format!("刷新文件失败: {}", e)))?;
         }
@@ -140,20 +141,16 @@ impl OutputManager {
         Ok(())
     }
 
-    /// 将行格式化为CSV（静态方法）
-    fn format_row_as_csv_static(row: &OutputRow, column_order: &[String]) -> String {
-        let mut values = Vec::new();
-        
-        for col_name in column_order {
-            let value_str = if let Some(value) = row.get(col_name) {
-                Self::value_to_csv_string_static(value)
-            } else {
-                String::new()
-            };
-            values.push(value_str);
+    /// 将行按CSV格式追加到缓冲区（静态方法），不构造中间的字段数组
+    fn push_row_as_csv_static(out: &mut String, row: &OutputRow, column_order: &[String]) {
+        for (i, col_name) in column_order.iter().enumerate() {
+            if i > 0 {
+                out.push(',');
+            }
+            if let Some(value) = row.get(col_name) {
+                out.push_str(&Self::value_to_csv_string_static(value));
+            }
         }
-
-        values.join(",")
     }
 
     /// 将Value转换为CSV字符串（静态方法）
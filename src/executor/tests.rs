@@ -1228,6 +1228,136 @@ return [result]
     }
 }
 
+#[test]
+fn test_max_function() {
+    let source = r#"
+-- INPUT nums:array, a:number, b:number, c:number --
+-- OUTPUT from_array:number, from_args:number --
+
+from_array = max(nums)
+from_args = max(a, b, c)
+return [from_array, from_args]
+"#;
+    let mut lexer = Lexer::new(source);
+    let tokens = lexer.tokenize().unwrap();
+    let mut parser = Parser::new(tokens);
+    let script = parser.parse().unwrap();
+    
+    // 数组参数与可变参数两种形式，null 值被跳过
+    let mut executor = Executor::new();
+    executor.set_input("nums".to_string(), Value::Array(vec![
+        Value::Number(3.0),
+        Value::Null,
+        Value::Number(-2.0),
+        Value::Number(7.0),
+    ]));
+    executor.set_input("a".to_string(), Value::Number(4.0));
+    executor.set_input("b".to_string(), Value::Null);
+    executor.set_input("c".to_string(), Value::Number(-1.0));
+    
+    let result = executor.execute_data_script(&script).unwrap();
+    
+    if let Some(Value::Array(arr)) = result {
+        assert_eq!(arr[0], Value::Number(7.0));
+        assert_eq!(arr[1], Value::Number(4.0));
+    } else {
+        panic!("Expected array result");
+    }
+    
+    // 全部为 null 时返回 null
+    let mut executor = Executor::new();
+    executor.set_input("nums".to_string(), Value::Array(vec![Value::Null, Value::Null]));
+    executor.set_input("a".to_string(), Value::Null);
+    executor.set_input("b".to_string(), Value::Null);
+    executor.set_input("c".to_string(), Value::Null);
+    
+    let result = executor.execute_data_script(&script).unwrap();
+    
+    if let Some(Value::Array(arr)) = result {
+        assert_eq!(arr[0], Value::Null);
+        assert_eq!(arr[1], Value::Null);
+    } else {
+        panic!("Expected array result");
+    }
+    
+    // 非数字操作数报错
+    let mut executor = Executor::new();
+    executor.set_input("nums".to_string(), Value::Array(vec![
+        Value::Number(1.0),
+        Value::String("abc".to_string()),
+    ]));
+    executor.set_input("a".to_string(), Value::Number(1.0));
+    executor.set_input("b".to_string(), Value::Number(2.0));
+    executor.set_input("c".to_string(), Value::Number(3.0));
+    
+    assert!(executor.execute_data_script(&script).is_err());
+}
+
+#[test]
+fn test_min_function() {
+    let source = r#"
+-- INPUT nums:array, a:number, b:number, c:number --
+-- OUTPUT from_array:number, from_args:number --
+
+from_array = min(nums)
+from_args = min(a, b, c)
+return [from_array, from_args]
+"#;
+    let mut lexer = Lexer::new(source);
+    let tokens = lexer.tokenize().unwrap();
+    let mut parser = Parser::new(tokens);
+    let script = parser.parse().unwrap();
+    
+    // 数组参数与可变参数两种形式，null 值被跳过
+    let mut executor = Executor::new();
+    executor.set_input("nums".to_string(), Value::Array(vec![
+        Value::Number(3.0),
+        Value::Null,
+        Value::Number(-2.0),
+        Value::Number(7.0),
+    ]));
+    executor.set_input("a".to_string(), Value::Number(4.0));
+    executor.set_input("b".to_string(), Value::Null);
+    executor.set_input("c".to_string(), Value::Number(-1.0));
+    
+    let result = executor.execute_data_script(&script).unwrap();
+    
+    if let Some(Value::Array(arr)) = result {
+        assert_eq!(arr[0], Value::Number(-2.0));
+        assert_eq!(arr[1], Value::Number(-1.0));
+    } else {
+        panic!("Expected array result");
+    }
+    
+    // 全部为 null 时返回 null
+    let mut executor = Executor::new();
+    executor.set_input("nums".to_string(), Value::Array(vec![Value::Null, Value::Null]));
+    executor.set_input("a".to_string(), Value::Null);
+    executor.set_input("b".to_string(), Value::Null);
+    executor.set_input("c".to_string(), Value::Null);
+    
+    let result = executor.execute_data_script(&script).unwrap();
+    
+    if let Some(Value::Array(arr)) = result {
+        assert_eq!(arr[0], Value::Null);
+        assert_eq!(arr[1], Value::Null);
+    } else {
+        panic!("Expected array result");
+    }
+    
+    // 非数字操作数报错
+    let mut executor = Executor::new();
+    executor.set_input("nums".to_string(), Value::Array(vec![
+        Value::Number(1.0),
+        Value::String("abc".to_string()),
+    ]));
+    executor.set_input("a".to_string(), Value::Number(1.0));
+    executor.set_input("b".to_string(), Value::Number(2.0));
+    executor.set_input("c".to_string(), Value::Number(3.0));
+    
+    assert!(executor.execute_data_script(&script).is_err());
+}
+
 #[test]
 fn test_first_last() {
     let source = r#"
@@ -10,4 +10,4 @@ pub mod api;
 
 // 导出公共 API
 pub use api::DPLangInterpreter;
-pub use api::{parse_csv, format_output_csv};
+pub use api::{parse_csv, format_output_csv, write_output_csv};
@@ -5,7 +5,7 @@ use dplang::{
     parser::Parser,
     executor::DataStreamExecutor,
     runtime::Value,
-    api::{parse_csv, format_output_csv},
+    api::{parse_csv, write_output_csv},
 };
 use std::collections::HashMap;
 use std::env;
@@ -171,12 +171,28 @@ fn run_script(script_path: &str, csv_path: Option<&String>) {
             if csv_path.is_some() {
                 // CSV输入时，输出CSV格式
                 println!("输出结果 (CSV格式):");
-                println!("{}", format_output_csv(&output));
+                // 直接流式写入标准输出，避免先拼接完整的 CSV 字符串
+                let stdout = io::stdout();
+                let mut out = io::BufWriter::new(stdout.lock());
+                let written = write_output_csv(&output, &mut out)
+                    .and_then(|_| writeln!(out))
+                    .and_then(|_| out.flush());
+                if let Err(e) = written {
+                    eprintln!("错误: 无法写入输出结果: {}", e);
+                }
             } else {
                 // 交互式输入时，输出JSON格式
                 println!("输出结果:");
-                for (i, row) in output.iter().enumerate() {
-                    println!("  行 {}: {:?}", i + 1, row);
+                // 只锁定一次标准输出并缓冲写入，避免每行 println! 各自加锁刷新
+                let stdout = io::stdout();
+                let mut out = io::BufWriter::new(stdout.lock());
+                let written = output
+                    .iter()
+                    .enumerate()
+                    .try_for_each(|(i, row)| writeln!(out, "  行 {}: {:?}", i + 1, row))
+                    .and_then(|_| out.flush());
+                if let Err(e) = written {
+                    eprintln!("错误: 无法写入输出结果: {}", e);
                 }
             }
         }
@@ -197,13 +213,14 @@ fn parse_simple_json(line: &str) -> Result<HashMap<String, Value>, ()> {
     let content = &line[1..line.len()-1];
     
     for pair in content.split(',') {
-        let parts: Vec<&str> = pair.split(':').collect();
-        if parts.len() != 2 {
-            continue;
-        }
+        // 单次切分出键和值，不为每个键值对分配 Vec
+        let (key_str, value_str) = match pair.split_once(':') {
+            Some((k, v)) if !v.contains(':') => (k, v),
+            _ => continue,
+        };
         
-        let key = parts[0].trim().trim_matches('"').to_string();
-        let value_str = parts[1].trim();
+        let key = key_str.trim().trim_matches('"').to_string();
+        let value_str = value_str.trim();
         
         let value = if value_str.starts_with('"') && value_str.ends_with('"') {
             // 字符串
@@ -147,13 +147,19 @@ impl Value {
         match (self, other) {
             (Value::Number(a), Value::Number(b)) => Ok(Value::Number(a + b)),
             (Value::Decimal(a), Value::Decimal(b)) => Ok(Value::Decimal(a + b)),
-            (Value::String(a), Value::String(b)) => Ok(Value::String(format!("{}{}", a, b))),
+            (Value::String(a), Value::String(b)) => {
+                // 一次性分配目标长度，不经过 format! 的格式化流程
+                let mut joined = String::with_capacity(a.len() + b.len());
+                joined.push_str(a);
+                joined.push_str(b);
+                Ok(Value::String(joined))
+            }
             (Value::Array(a), Value::Array(b)) => {
                 // 向量加法 (逐元素)
                 if a.len() != b.len() {
                     return Err(RuntimeError::type_error("数组长度不匹配"));
                 }
-                let mut result = Vec::new();
+                let mut result = Vec::with_capacity(a.len());
                 for (av, bv) in a.iter().zip(b.iter()) {
                     result.push(av.add(bv)?);
                 }
@@ -161,7 +167,7 @@ impl Value {
             }
             (Value::Array(a), scalar) | (scalar, Value::Array(a)) if !matches!(scalar, Value::Array(_)) => {
                 // 数组与标量相加 (广播)
-                let mut result = Vec::new();
+                let mut result = Vec::with_capacity(a.len());
                 for av in a.iter() {
                     result.push(av.add(scalar)?);
                 }
@@ -180,21 +186,21 @@ impl Value {
                 if a.len() != b.len() {
                     return Err(RuntimeError::type_error("数组长度不匹配"));
                 }
-                let mut result = Vec::new();
+                let mut result = Vec::with_capacity(a.len());
                 for (av, bv) in a.iter().zip(b.iter()) {
                     result.push(av.sub(bv)?);
                 }
                 Ok(Value::Array(result))
             }
             (Value::Array(a), scalar) => {
-                let mut result = Vec::new();
+                let mut result = Vec::with_capacity(a.len());
                 for av in a.iter() {
                     result.push(av.sub(scalar)?);
                 }
                 Ok(Value::Array(result))
             }
             (scalar, Value::Array(a)) if !matches!(scalar, Value::Array(_)) => {
-                let mut result = Vec::new();
+                let mut result = Vec::with_capacity(a.len());
                 for av in a.iter() {
                     result.push(scalar.sub(av)?);
                 }
@@ -213,14 +219,14 @@ impl Value {
                 if a.len() != b.len() {
                     return Err(RuntimeError::type_error("数组长度不匹配"));
                 }
-                let mut result = Vec::new();
+                let mut result = Vec::with_capacity(a.len());
                 for (av, bv) in a.iter().zip(b.iter()) {
                     result.push(av.mul(bv)?);
                 }
                 Ok(Value::Array(result))
             }
             (Value::Array(a), scalar) | (scalar, Value::Array(a)) if !matches!(scalar, Value::Array(_)) => {
-                let mut result = Vec::new();
+                let mut result = Vec::with_capacity(a.len());
                 for av in a.iter() {
                     result.push(av.mul(scalar)?);
                 }
@@ -249,21 +255,21 @@ impl Value {
                 if a.len() != b.len() {
                     return Err(RuntimeError::type_error("数组长度不匹配"));
                 }
-                let mut result = Vec::new();
+                let mut result = Vec::with_capacity(a.len());
                 for (av, bv) in a.iter().zip(b.iter()) {
                     result.push(av.div(bv)?);
                 }
                 Ok(Value::Array(result))
             }
             (Value::Array(a), scalar) => {
-                let mut result = Vec::new();
+                let mut result = Vec::with_capacity(a.len());
                 for av in a.iter() {
                     result.push(av.div(scalar)?);
                 }
                 Ok(Value::Array(result))
             }
             (scalar, Value::Array(a)) if !matches!(scalar, Value::Array(_)) => {
-                let mut result = Vec::new();
+                let mut result = Vec::with_capacity(a.len());
                 for av in a.iter() {
                     result.push(scalar.div(av)?);
                 }
@@ -304,14 +310,14 @@ impl Value {
                 if a.len() != b.len() {
                     return Err(RuntimeError::type_error("数组长度不匹配"));
                 }
-                let mut result = Vec::new();
+                let mut result = Vec::with_capacity(a.len());
                 for (av, bv) in a.iter().zip(b.iter()) {
                     result.push(av.gt(bv)?);
                 }
                 Ok(Value::Array(result))
             }
             (Value::Array(a), scalar) | (scalar, Value::Array(a)) if !matches!(scalar, Value::Array(_)) => {
-                let mut result = Vec::new();
+                let mut result = Vec::with_capacity(a.len());
                 for av in a.iter() {
                     result.push(if matches!(self, Value::Array(_)) { av.gt(scalar)? } else { scalar.gt(av)? });
                 }
@@ -348,7 +354,7 @@ impl Value {
                 if a.len() != b.len() {
                     return Err(RuntimeError::type_error("数组长度不匹配"));
                 }
-                let mut result = Vec::new();
+                let mut result = Vec::with_capacity(a.len());
                 for (av, bv) in a.iter().zip(b.iter()) {
                     result.push(Value::Bool(av.to_bool() && bv.to_bool()));
                 }
@@ -365,7 +371,7 @@ impl Value {
                 if a.len() != b.len() {
                     return Err(RuntimeError::type_error("数组长度不匹配"));
                 }
-                let mut result = Vec::new();
+                let mut result = Vec::with_capacity(a.len());
                 for (av, bv) in a.iter().zip(b.iter()) {
                     result.push(Value::Bool(av.to_bool() || bv.to_bool()));
                 }
@@ -379,7 +385,7 @@ impl Value {
     pub fn not(&self) -> Result<Value, RuntimeError> {
         match self {
             Value::Array(a) => {
-                let mut result = Vec::new();
+                let mut result = Vec::with_capacity(a.len());
                 for av in a.iter() {
                     result.push(Value::Bool(!av.to_bool()));
                 }
@@ -395,7 +401,7 @@ impl Value {
             Value::Number(n) => Ok(Value::Number(-n)),
             Value::Decimal(d) => Ok(Value::Decimal(-d)),
             Value::Array(a) => {
-                let mut result = Vec::new();
+                let mut result = Vec::with_capacity(a.len());
                 for av in a.iter() {
                     result.push(av.neg()?);
                 }